@@ -5,6 +5,7 @@ Builds valid JQL queries from filter parameters
 """
 
 import json
+from functools import lru_cache
 from typing import Dict, List, Optional
 from urllib.parse import quote
 
@@ -12,47 +13,62 @@ from urllib.parse import quote
 class JQLBuilder:
     """Builds JQL queries for Jira PPLWEBMYST project"""
 
+    __slots__ = ("conditions", "project", "order_clause")
+
+    # Fields whose string values are always quoted
+    _ALWAYS_QUOTED = frozenset({"status", "priority", "type"})
+
     def __init__(self):
         self.conditions = []
         self.project = "PPLWEBMYST"
+        self.order_clause = None
 
     def add_condition(self, field: str, operator: str, value) -> "JQLBuilder":
         """Add a condition to the query"""
-        if isinstance(value, str):
-            # Quote string values, handle special cases
-            if field in ["status", "priority", "type"]:
-                value = f'"{value}"'
-            elif " " in str(value):
-                value = f'"{value}"'
-        elif isinstance(value, list):
+        if isinstance(value, list):
             # Handle IN operator
-            quoted_values = [f'"{v}"' if isinstance(v, str) else str(v) for v in value]
-            value = f"({', '.join(quoted_values)})"
-            operator = "IN"
+            return self._add_in_condition(field, value)
+        if isinstance(value, str) and field in JQLBuilder._ALWAYS_QUOTED:
+            return self._add_quoted_condition(field, operator, value)
+        return self._add_scalar_condition(field, operator, value)
+
+    def _add_scalar_condition(self, field: str, operator: str, value) -> "JQLBuilder":
+        """Add a condition, quoting string values that contain spaces"""
+        if isinstance(value, str) and " " in value:
+            value = f'"{value}"'
+        self.conditions.append(f"{field} {operator} {value}")
+        return self
 
-        condition = f"{field} {operator} {value}"
-        self.conditions.append(condition)
+    def _add_quoted_condition(self, field: str, operator: str, value: str) -> "JQLBuilder":
+        """Add a condition with an always-quoted string value"""
+        self.conditions.append(f'{field} {operator} "{value}"')
+        return self
+
+    def _add_in_condition(self, field: str, values: List) -> "JQLBuilder":
+        """Add an IN condition, quoting string values"""
+        quoted_values = [f'"{v}"' if isinstance(v, str) else str(v) for v in values]
+        self.conditions.append(f"{field} IN ({', '.join(quoted_values)})")
         return self
 
     def status(self, status: str) -> "JQLBuilder":
         """Filter by status"""
-        return self.add_condition("status", "=", status)
+        return self._add_quoted_condition("status", "=", status)
 
     def status_in(self, statuses: List[str]) -> "JQLBuilder":
         """Filter by multiple statuses"""
-        return self.add_condition("status", "IN", statuses)
+        return self._add_in_condition("status", statuses)
 
     def issue_type(self, issue_type: str) -> "JQLBuilder":
         """Filter by issue type"""
-        return self.add_condition("type", "=", issue_type)
+        return self._add_quoted_condition("type", "=", issue_type)
 
     def issue_types(self, types: List[str]) -> "JQLBuilder":
         """Filter by multiple issue types"""
-        return self.add_condition("type", "IN", types)
+        return self._add_in_condition("type", types)
 
     def assignee(self, user_email: str) -> "JQLBuilder":
         """Filter by assignee"""
-        return self.add_condition("assignee", "=", user_email)
+        return self._add_scalar_condition("assignee", "=", user_email)
 
     def unassigned(self) -> "JQLBuilder":
         """Filter unassigned issues"""
@@ -61,14 +77,15 @@ class JQLBuilder:
 
     def priority(self, priority: str) -> "JQLBuilder":
         """Filter by priority"""
-        return self.add_condition("priority", "=", priority)
+        return self._add_quoted_condition("priority", "=", priority)
 
     def priorities(self, priorities: List[str]) -> "JQLBuilder":
         """Filter by multiple priorities"""
-        return self.add_condition("priority", "IN", priorities)
+        return self._add_in_condition("priority", priorities)
 
     def sprint(self, sprint_id_or_name) -> "JQLBuilder":
         """Filter by sprint"""
+        # Ids, names or a list of either, so dispatch on the value like add_condition
         return self.add_condition("sprint", "=", sprint_id_or_name)
 
     def no_sprint(self) -> "JQLBuilder":
@@ -78,19 +95,19 @@ class JQLBuilder:
 
     def label(self, label: str) -> "JQLBuilder":
         """Filter by label"""
-        return self.add_condition("labels", "=", label)
+        return self._add_scalar_condition("labels", "=", label)
 
     def component(self, component: str) -> "JQLBuilder":
         """Filter by component"""
-        return self.add_condition("components", "=", component)
+        return self._add_scalar_condition("components", "=", component)
 
     def due_date_before(self, date: str) -> "JQLBuilder":
         """Filter issues with duedate before date (YYYY-MM-DD)"""
-        return self.add_condition("duedate", "<", date)
+        return self._add_scalar_condition("duedate", "<", date)
 
     def due_date_after(self, date: str) -> "JQLBuilder":
         """Filter issues with duedate after date (YYYY-MM-DD)"""
-        return self.add_condition("duedate", ">", date)
+        return self._add_scalar_condition("duedate", ">", date)
 
     def due_date_overdue(self) -> "JQLBuilder":
         """Filter overdue issues"""
@@ -110,11 +127,7 @@ class JQLBuilder:
 
     def custom_field(self, field_id: str, operator: str, value) -> "JQLBuilder":
         """Add custom field filter (e.g., customfield_10824 = "Produccion")"""
-        if isinstance(value, str) and " " in value:
-            value = f'"{value}"'
-        condition = f"{field_id} {operator} {value}"
-        self.conditions.append(condition)
-        return self
+        return self._add_scalar_condition(field_id, operator, value)
 
     def bug_environment(self, environment: str) -> "JQLBuilder":
         """Filter by bug environment (customfield_10824)"""
@@ -146,16 +159,12 @@ class JQLBuilder:
 
     def build(self) -> str:
         """Build and return the complete JQL query"""
-        # Always start with project
-        query = f"project = {self.project}"
-
-        # Add all conditions
-        if self.conditions:
-            query += " AND " + " AND ".join(self.conditions)
+        # Always start with project, then all conditions
+        query = " AND ".join([f"project = {self.project}", *self.conditions])
 
         # Add ordering if specified
-        if hasattr(self, "order_clause"):
-            query += f" {self.order_clause}"
+        if self.order_clause is not None:
+            return f"{query} {self.order_clause}"
 
         return query
 
@@ -166,16 +175,16 @@ class JQLBuilder:
     def reset(self) -> "JQLBuilder":
         """Reset builder for new query"""
         self.conditions = []
-        if hasattr(self, "order_clause"):
-            del self.order_clause
+        self.order_clause = None
         return self
 
 
 # Common query templates
 class JQLTemplates:
-    """Pre-built common queries for PPLWEBMYST"""
+    """Pre-built common queries for PPLWEBMYST (results are cached per argument)"""
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def my_open_issues(user_email: str) -> str:
         """Issues assigned to me that are open"""
         return (
@@ -186,16 +195,19 @@ class JQLTemplates:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def unassigned_bugs() -> str:
         """All unassigned bugs"""
         return JQLBuilder().issue_type("Bug").unassigned().build()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def bugs_in_production() -> str:
         """Bugs reported in production"""
         return JQLBuilder().issue_type("Bug").bug_environment("Produccion").build()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def current_sprint_backlog() -> str:
         """Current sprint issues ready to start"""
         return (
@@ -207,21 +219,25 @@ class JQLTemplates:
         )
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def overdue_issues() -> str:
         """Overdue unresolved issues"""
         return JQLBuilder().due_date_overdue().order_by("duedate", "ASC").build()
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def recently_updated(days: int = 7) -> str:
         """Issues updated in last N days"""
         return JQLBuilder().updated_after(days).order_by("updated", "DESC").build()
 
     @staticmethod
+    @lru_cache(maxsize=None)
     def issues_without_owner() -> str:
         """Issues missing vertical owner"""
         return JQLBuilder().no_vertical_owner().order_by("created", "DESC").build()
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def by_epic(epic_key: str) -> str:
         """All issues in an epic"""
         return (
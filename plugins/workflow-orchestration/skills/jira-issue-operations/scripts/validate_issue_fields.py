@@ -6,247 +6,323 @@ Validates issue fields against project-specific rules before creation/update
 
 import json
 from typing import Dict, List, Tuple
-from datetime import datetime
+from datetime import date
 import re
 
+# Precompiled patterns
+_DATE_RE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+# Calendar-checkable dates: ASCII digits only and no trailing newline, which _DATE_RE lets through
+_DATE_DIGITS_RE = re.compile(r"[0-9]{4}-[0-9]{2}-[0-9]{2}")
+_ISSUE_KEY_RE = re.compile(r"^[A-Z]+-\d+$")
+
+# Text field length limits
+_SUMMARY_MAX_LENGTH = 200
+_DESCRIPTION_MAX_LENGTH = 5000
+
+# Valid issue types in PPLWEBMYST
+VALID_TYPES = [
+    "Épica",
+    "Historia",
+    "Task",
+    "Bug",
+    "Sub-task",
+    "Initiative",
+    "Spike",
+    "Strategic Theme",
+    "Design",
+]
+VALID_TYPES_SET = frozenset(VALID_TYPES)
+_VALID_TYPES_STR = ", ".join(VALID_TYPES)
+
+# Valid workflow states
+VALID_STATES = [
+    "Open",
+    "Analyzing",
+    "Backlog",
+    "Ready to Start",
+    "Prioritized",
+    "In Progress",
+    "Ready to Verify",
+    "Deployed",
+    "Closed",
+    "Epic Refinement",
+    "Discarded",
+    "To deploy",
+    "Delayed",
+]
+VALID_STATES_SET = frozenset(VALID_STATES)
+
+# Valid priorities
+VALID_PRIORITIES = ["A++ (Bloqueo)", "A+ (Crítico)", "A (Muy Importante)", "B (Importante)", "C (Menor)", "D (Trivial)"]
+VALID_PRIORITIES_SET = frozenset(VALID_PRIORITIES)
+_VALID_PRIORITIES_STR = ", ".join(VALID_PRIORITIES)
+
+# Valid bug environments
+VALID_BUG_ENVIRONMENTS = ["Produccion", "Pre-produccion", "Testing", "Desarrollo"]
+VALID_BUG_ENVIRONMENTS_SET = frozenset(VALID_BUG_ENVIRONMENTS)
+_VALID_BUG_ENVIRONMENTS_STR = ", ".join(VALID_BUG_ENVIRONMENTS)
+
+# Issue type requirements
+REQUIRED_FIELDS = {
+    "Épica": ("summary", "customfield_11762"),
+    "Historia": ("summary",),
+    "Task": ("summary",),
+    "Bug": ("summary", "customfield_10824"),
+    "Sub-task": ("summary", "parent"),
+    "Initiative": ("summary",),
+    "Spike": ("summary",),
+    "Strategic Theme": ("summary",),
+    "Design": ("summary",),
+}
+DEFAULT_REQUIRED_FIELDS = ("summary",)
+
+
+def _validate_summary(summary: str) -> Tuple[bool, str]:
+    """Validate summary field (1-200 chars, non-empty)"""
+    if not summary or not isinstance(summary, str):
+        return False, "Summary is required and must be a string"
 
-class JiraFieldValidator:
-    """Validates Jira issue fields against PPLWEBMYST rules"""
+    summary = summary.strip()
+    if len(summary) < 1:
+        return False, "Summary cannot be empty"
+    if len(summary) > _SUMMARY_MAX_LENGTH:
+        return False, f"Summary exceeds {_SUMMARY_MAX_LENGTH} characters (current: {len(summary)})"
+
+    return True, "Summary is valid"
+
+
+def _validate_description(description: str) -> Tuple[bool, str]:
+    """Validate description field (max 5000 chars)"""
+    if description is None:
+        return True, "Description is optional"
+
+    if not isinstance(description, str):
+        return False, "Description must be a string"
+
+    if len(description) > _DESCRIPTION_MAX_LENGTH:
+        return False, f"Description exceeds {_DESCRIPTION_MAX_LENGTH} characters (current: {len(description)})"
+
+    return True, "Description is valid"
+
+
+def _validate_issue_type(issue_type: str) -> Tuple[bool, str]:
+    """Validate issue type is supported"""
+    if not issue_type or issue_type not in VALID_TYPES_SET:
+        return False, f"Invalid issue type. Must be one of: {_VALID_TYPES_STR}"
+
+    # Prevent use of "Epic" (must use "Épica")
+    if issue_type.lower() == "epic":
+        return False, "Use 'Épica' not 'Epic' for issue type"
+
+    return True, "Issue type is valid"
+
+
+def _validate_priority(priority: str) -> Tuple[bool, str]:
+    """Validate priority field"""
+    if priority is None:
+        return True, "Priority is optional"
+
+    if priority not in VALID_PRIORITIES_SET:
+        return False, f"Invalid priority. Must be one of: {_VALID_PRIORITIES_STR}"
+
+    return True, "Priority is valid"
+
+
+def _validate_bug_environment(environment: str) -> Tuple[bool, str]:
+    """Validate bug environment custom field"""
+    if environment not in VALID_BUG_ENVIRONMENTS_SET:
+        return False, f"Invalid bug environment. Must be one of: {_VALID_BUG_ENVIRONMENTS_STR}"
+
+    return True, "Bug environment is valid"
+
+
+def _is_calendar_date(duedate: str) -> bool:
+    """True for a real date in strict YYYY-MM-DD form"""
+    if not _DATE_DIGITS_RE.fullmatch(duedate):
+        return False
+
+    # Once the digits are checked, build the date directly (much cheaper than strptime)
+    try:
+        date(int(duedate[0:4]), int(duedate[5:7]), int(duedate[8:10]))
+        return True
+    except ValueError:
+        return False
+
+
+def _validate_duedate(duedate: str) -> Tuple[bool, str]:
+    """Validate duedate field (YYYY-MM-DD format)"""
+    if duedate is None:
+        return True, "Duedate is optional"
+
+    if not _DATE_RE.match(duedate):
+        return False, f"Duedate must be in YYYY-MM-DD format (got: {duedate})"
+
+    if not _is_calendar_date(duedate):
+        return False, f"Invalid date: {duedate}"
+
+    return True, "Duedate is valid"
+
+
+def _validate_epic_name_match(summary: str, epic_name: str) -> Tuple[bool, str]:
+    """For Épica type: customfield_11762 must exactly match summary"""
+    if epic_name != summary:
+        return False, f"Epic Name (customfield_11762) must exactly match summary. Summary: '{summary}', Epic Name: '{epic_name}'"
+
+    return True, "Epic name matches summary"
+
+
+def _validate_parent_issue_key(parent_key: str) -> Tuple[bool, str]:
+    """Validate parent issue key format (PROJECT-NUMBER)"""
+    if not _ISSUE_KEY_RE.match(parent_key):
+        return False, f"Invalid parent issue key format: {parent_key}. Expected: PROJECT-NUMBER"
+
+    return True, "Parent issue key format is valid"
 
-    # Valid issue types in PPLWEBMYST
-    VALID_TYPES = [
-        "Épica",
-        "Historia",
-        "Task",
-        "Bug",
-        "Sub-task",
-        "Initiative",
-        "Spike",
-        "Strategic Theme",
-        "Design",
-    ]
-
-    # Valid workflow states
-    VALID_STATES = [
-        "Open",
-        "Analyzing",
-        "Backlog",
-        "Ready to Start",
-        "Prioritized",
-        "In Progress",
-        "Ready to Verify",
-        "Deployed",
-        "Closed",
-        "Epic Refinement",
-        "Discarded",
-        "To deploy",
-        "Delayed",
-    ]
-
-    # Valid priorities
-    VALID_PRIORITIES = ["A++ (Bloqueo)", "A+ (Crítico)", "A (Muy Importante)", "B (Importante)", "C (Menor)", "D (Trivial)"]
-
-    # Valid bug environments
-    VALID_BUG_ENVIRONMENTS = ["Produccion", "Pre-produccion", "Testing", "Desarrollo"]
-
-    # Issue type requirements
-    REQUIRED_FIELDS = {
-        "Épica": ["summary", "customfield_11762"],
-        "Historia": ["summary"],
-        "Task": ["summary"],
-        "Bug": ["summary", "customfield_10824"],
-        "Sub-task": ["summary", "parent"],
-        "Initiative": ["summary"],
-        "Spike": ["summary"],
-        "Strategic Theme": ["summary"],
-        "Design": ["summary"],
-    }
 
-    @staticmethod
-    def validate_summary(summary: str) -> Tuple[bool, str]:
-        """Validate summary field (1-200 chars, non-empty)"""
-        if not summary or not isinstance(summary, str):
-            return False, "Summary is required and must be a string"
-
-        summary = summary.strip()
-        if len(summary) < 1:
-            return False, "Summary cannot be empty"
-        if len(summary) > 200:
-            return False, f"Summary exceeds 200 characters (current: {len(summary)})"
-
-        return True, "Summary is valid"
-
-    @staticmethod
-    def validate_description(description: str) -> Tuple[bool, str]:
-        """Validate description field (max 5000 chars)"""
-        if description is None:
-            return True, "Description is optional"
-
-        if not isinstance(description, str):
-            return False, "Description must be a string"
-
-        if len(description) > 5000:
-            return False, f"Description exceeds 5000 characters (current: {len(description)})"
-
-        return True, "Description is valid"
-
-    @staticmethod
-    def validate_issue_type(issue_type: str) -> Tuple[bool, str]:
-        """Validate issue type is supported"""
-        if not issue_type or issue_type not in JiraFieldValidator.VALID_TYPES:
-            valid = ", ".join(JiraFieldValidator.VALID_TYPES)
-            return False, f"Invalid issue type. Must be one of: {valid}"
-
-        # Prevent use of "Epic" (must use "Épica")
-        if issue_type.lower() == "epic":
-            return False, "Use 'Épica' not 'Epic' for issue type"
-
-        return True, "Issue type is valid"
-
-    @staticmethod
-    def validate_priority(priority: str) -> Tuple[bool, str]:
-        """Validate priority field"""
-        if priority is None:
-            return True, "Priority is optional"
-
-        if priority not in JiraFieldValidator.VALID_PRIORITIES:
-            valid = ", ".join(JiraFieldValidator.VALID_PRIORITIES)
-            return False, f"Invalid priority. Must be one of: {valid}"
-
-        return True, "Priority is valid"
-
-    @staticmethod
-    def validate_bug_environment(environment: str) -> Tuple[bool, str]:
-        """Validate bug environment custom field"""
-        if environment not in JiraFieldValidator.VALID_BUG_ENVIRONMENTS:
-            valid = ", ".join(JiraFieldValidator.VALID_BUG_ENVIRONMENTS)
-            return False, f"Invalid bug environment. Must be one of: {valid}"
-
-        return True, "Bug environment is valid"
-
-    @staticmethod
-    def validate_duedate(duedate: str) -> Tuple[bool, str]:
-        """Validate duedate field (YYYY-MM-DD format)"""
-        if duedate is None:
-            return True, "Duedate is optional"
-
-        pattern = r"^\d{4}-\d{2}-\d{2}$"
-        if not re.match(pattern, duedate):
-            return False, f"Duedate must be in YYYY-MM-DD format (got: {duedate})"
-
-        try:
-            datetime.strptime(duedate, "%Y-%m-%d")
-            return True, "Duedate is valid"
-        except ValueError:
-            return False, f"Invalid date: {duedate}"
-
-    @staticmethod
-    def validate_epic_name_match(summary: str, epic_name: str) -> Tuple[bool, str]:
-        """For Épica type: customfield_11762 must exactly match summary"""
-        if epic_name != summary:
-            return False, f"Epic Name (customfield_11762) must exactly match summary. Summary: '{summary}', Epic Name: '{epic_name}'"
-
-        return True, "Epic name matches summary"
-
-    @staticmethod
-    def validate_parent_issue_key(parent_key: str) -> Tuple[bool, str]:
-        """Validate parent issue key format (PROJECT-NUMBER)"""
-        pattern = r"^[A-Z]+-\d+$"
-        if not re.match(pattern, parent_key):
-            return False, f"Invalid parent issue key format: {parent_key}. Expected: PROJECT-NUMBER"
-
-        return True, "Parent issue key format is valid"
-
-    @staticmethod
-    def validate_issue_fields(issue_data: Dict) -> Dict:
-        """
-        Comprehensive validation of all issue fields
-        Returns: {"valid": bool, "errors": [], "warnings": []}
-        """
-        errors = []
-        warnings = []
-
-        issue_type = issue_data.get("issuetype", {})
-        if isinstance(issue_type, dict):
-            issue_type_name = issue_type.get("name")
-        else:
-            issue_type_name = str(issue_type)
-
-        # Validate issue type first
-        valid, msg = JiraFieldValidator.validate_issue_type(issue_type_name)
+def _validate_issue_fields(issue_data: Dict) -> Dict:
+    """
+    Comprehensive validation of all issue fields
+    Returns: {"valid": bool, "errors": [], "warnings": []}
+    """
+    return _check_issue_fields(issue_data, True)
+
+
+def _check_issue_fields(issue_data: Dict, check_text_fields: bool) -> Dict:
+    """validate_issue_fields, skipping summary/description/duedate unless check_text_fields"""
+    errors = []
+    warnings = []
+
+    issue_type = issue_data.get("issuetype", {})
+    if isinstance(issue_type, dict):
+        issue_type_name = issue_type.get("name")
+    else:
+        issue_type_name = str(issue_type)
+
+    # Validate issue type first
+    valid, msg = _validate_issue_type(issue_type_name)
+    if not valid:
+        errors.append({"field": "issuetype", "error": msg})
+        return {"valid": False, "errors": errors, "warnings": warnings}
+
+    # Validate required fields for this type
+    required_fields = REQUIRED_FIELDS.get(issue_type_name, DEFAULT_REQUIRED_FIELDS)
+    missing = [field for field in required_fields if not issue_data.get(field)]
+    if missing:
+        error = f"Required field for {issue_type_name} type"
+        errors.extend({"field": field, "error": error} for field in missing)
+
+    # Validate summary if present
+    if check_text_fields and "summary" in issue_data:
+        valid, msg = _validate_summary(issue_data["summary"])
         if not valid:
-            errors.append({"field": "issuetype", "error": msg})
-            return {"valid": False, "errors": errors, "warnings": warnings}
-
-        # Validate required fields for this type
-        required_fields = JiraFieldValidator.REQUIRED_FIELDS.get(issue_type_name, ["summary"])
-        for field in required_fields:
-            if field not in issue_data or not issue_data[field]:
-                errors.append({"field": field, "error": f"Required field for {issue_type_name} type"})
-
-        # Validate summary if present
-        if "summary" in issue_data:
-            valid, msg = JiraFieldValidator.validate_summary(issue_data["summary"])
-            if not valid:
-                errors.append({"field": "summary", "error": msg})
+            errors.append({"field": "summary", "error": msg})
+
+    # Validate description if present
+    if check_text_fields and "description" in issue_data:
+        valid, msg = _validate_description(issue_data["description"])
+        if not valid:
+            errors.append({"field": "description", "error": msg})
 
-        # Validate description if present
-        if "description" in issue_data:
-            valid, msg = JiraFieldValidator.validate_description(issue_data["description"])
+    # Validate priority if present
+    if "priority" in issue_data:
+        valid, msg = _validate_priority(issue_data.get("priority", {}).get("name"))
+        if not valid:
+            errors.append({"field": "priority", "error": msg})
+
+    # Type-specific validations
+    if issue_type_name == "Épica":
+        # Must have epic name matching summary
+        epic_name = issue_data.get("customfield_11762")
+        if epic_name:
+            valid, msg = _validate_epic_name_match(issue_data["summary"], epic_name)
             if not valid:
-                errors.append({"field": "description", "error": msg})
+                errors.append({"field": "customfield_11762", "error": msg})
 
-        # Validate priority if present
-        if "priority" in issue_data:
-            valid, msg = JiraFieldValidator.validate_priority(issue_data.get("priority", {}).get("name"))
+    elif issue_type_name == "Bug":
+        # Must have environment
+        env = issue_data.get("customfield_10824")
+        if env:
+            valid, msg = _validate_bug_environment(env)
             if not valid:
-                errors.append({"field": "priority", "error": msg})
-
-        # Type-specific validations
-        if issue_type_name == "Épica":
-            # Must have epic name matching summary
-            epic_name = issue_data.get("customfield_11762")
-            if epic_name:
-                valid, msg = JiraFieldValidator.validate_epic_name_match(issue_data["summary"], epic_name)
-                if not valid:
-                    errors.append({"field": "customfield_11762", "error": msg})
-
-        elif issue_type_name == "Bug":
-            # Must have environment
-            env = issue_data.get("customfield_10824")
-            if env:
-                valid, msg = JiraFieldValidator.validate_bug_environment(env)
-                if not valid:
-                    errors.append({"field": "customfield_10824", "error": msg})
-
-        elif issue_type_name == "Sub-task":
-            # Must have parent
-            parent = issue_data.get("parent")
-            if parent:
-                parent_key = parent if isinstance(parent, str) else parent.get("key")
-                valid, msg = JiraFieldValidator.validate_parent_issue_key(parent_key)
-                if not valid:
-                    errors.append({"field": "parent", "error": msg})
-
-        # Validate duedate if present
-        if "duedate" in issue_data:
-            valid, msg = JiraFieldValidator.validate_duedate(issue_data["duedate"])
+                errors.append({"field": "customfield_10824", "error": msg})
+
+    elif issue_type_name == "Sub-task":
+        # Must have parent
+        parent = issue_data.get("parent")
+        if parent:
+            parent_key = parent if isinstance(parent, str) else parent.get("key")
+            valid, msg = _validate_parent_issue_key(parent_key)
             if not valid:
-                errors.append({"field": "duedate", "error": msg})
+                errors.append({"field": "parent", "error": msg})
+
+    # PPLWEBMYST-specific warnings
+    if issue_type_name == "Bug" and "assignee" not in issue_data:
+        warnings.append({"field": "assignee", "warning": "Bug must be assigned to QA team"})
 
-        # PPLWEBMYST-specific warnings
-        if issue_type_name == "Bug" and "assignee" not in issue_data:
-            warnings.append({"field": "assignee", "warning": "Bug must be assigned to QA team"})
+    if "customfield_42960" not in issue_data and issue_data.get("status") == "Open":
+        warnings.append({"field": "customfield_42960", "warning": "Consider populating Vertical Owner for classification"})
 
-        if "customfield_42960" not in issue_data and issue_data.get("status") == "Open":
-            warnings.append({"field": "customfield_42960", "warning": "Consider populating Vertical Owner for classification"})
+    # Validate duedate last, after the cheap checks
+    if check_text_fields and "duedate" in issue_data:
+        valid, msg = _validate_duedate(issue_data["duedate"])
+        if not valid:
+            errors.append({"field": "duedate", "error": msg})
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "issue_type": issue_type_name,
+    }
+
+
+def _text_fields_ok(issue_data: Dict) -> bool:
+    """True when summary, description and duedate (those present) would all pass validation"""
+    summary = issue_data.get("summary", "-")
+    description = issue_data.get("description")
+    duedate = issue_data.get("duedate")
+    return (
+        isinstance(summary, str) and 0 < len(summary.strip()) <= _SUMMARY_MAX_LENGTH
+        and (description is None or (isinstance(description, str) and len(description) <= _DESCRIPTION_MAX_LENGTH))
+        and (duedate is None or _is_calendar_date(duedate))
+    )
+
+
+def _validate_issue_batch(issues: List[Dict]) -> List[Dict]:
+    """
+    Validate many issues at once (e.g. a Jira export)
+    Returns one validate_issue_fields result per issue, in input order
+    """
+    # Screen the text fields for the whole batch first; only issues that fail get their messages built
+    text_ok = [_text_fields_ok(issue_data) for issue_data in issues]
+    return [_check_issue_fields(issue_data, not ok) for issue_data, ok in zip(issues, text_ok)]
+
+
+class JiraFieldValidator:
+    """Validates Jira issue fields against PPLWEBMYST rules"""
 
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "issue_type": issue_type_name,
-        }
+    # Module-level constants and functions, kept on the class for backwards compatibility
+    VALID_TYPES = VALID_TYPES
+    VALID_TYPES_SET = VALID_TYPES_SET
+    VALID_STATES = VALID_STATES
+    VALID_STATES_SET = VALID_STATES_SET
+    VALID_PRIORITIES = VALID_PRIORITIES
+    VALID_PRIORITIES_SET = VALID_PRIORITIES_SET
+    VALID_BUG_ENVIRONMENTS = VALID_BUG_ENVIRONMENTS
+    VALID_BUG_ENVIRONMENTS_SET = VALID_BUG_ENVIRONMENTS_SET
+    REQUIRED_FIELDS = REQUIRED_FIELDS
+    DEFAULT_REQUIRED_FIELDS = DEFAULT_REQUIRED_FIELDS
+
+    validate_summary = staticmethod(_validate_summary)
+    validate_description = staticmethod(_validate_description)
+    validate_issue_type = staticmethod(_validate_issue_type)
+    validate_priority = staticmethod(_validate_priority)
+    validate_bug_environment = staticmethod(_validate_bug_environment)
+    validate_duedate = staticmethod(_validate_duedate)
+    validate_epic_name_match = staticmethod(_validate_epic_name_match)
+    validate_parent_issue_key = staticmethod(_validate_parent_issue_key)
+    validate_issue_fields = staticmethod(_validate_issue_fields)
+    validate_issue_batch = staticmethod(_validate_issue_batch)
 
 
 if __name__ == "__main__":
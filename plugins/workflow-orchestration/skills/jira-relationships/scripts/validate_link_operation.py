@@ -6,207 +6,268 @@ Validates issue links before creation to prevent errors and circular dependencie
 
 import json
 import re
-from typing import Tuple, Dict, List
+from collections import defaultdict
+from functools import lru_cache
+from typing import Tuple, Dict, List, Set, Union
 
+# Precompiled patterns
+_ISSUE_KEY_RE = re.compile(r"^[A-Z]+-\d+$")
+_PPLWEBMYST_KEY_RE = re.compile(r"^PPLWEBMYST-(\d+)$")
 
-class LinkValidator:
-    """Validates issue link operations"""
 
-    # Valid link types
-    VALID_LINK_TYPES = [
-        "Blocks",
-        "Relates to",
-        "Duplicates",
-        "Clones",
-        "is part of",  # Epic link
-    ]
+@lru_cache(maxsize=4096)
+def _is_valid_key(issue_key: str) -> bool:
+    """Check issue key format (PROJECT-NUMBER), memoized for repeated keys"""
+    return _ISSUE_KEY_RE.match(issue_key) is not None
 
-    # Directional links (have outward/inward)
-    DIRECTIONAL_LINKS = {
-        "Blocks": {"outward": "blocks", "inward": "is blocked by"},
-        "Relates to": {"outward": "relates to", "inward": "relates to"},
-        "Duplicates": {"outward": "duplicates", "inward": "is duplicated by"},
-        "Clones": {"outward": "clones", "inward": "is cloned by"},
-        "is part of": {"outward": "is part of", "inward": "contains"},
-    }
 
-    @staticmethod
-    def validate_issue_key_format(issue_key: str) -> Tuple[bool, str]:
-        """Validate issue key format (PROJECT-NUMBER)"""
-        pattern = r"^[A-Z]+-\d+$"
-        if not re.match(pattern, issue_key):
-            return False, f"Invalid issue key format: {issue_key}. Expected: PROJECT-NUMBER"
-
-        return True, "Issue key format is valid"
-
-    @staticmethod
-    def validate_issue_key_project(issue_key: str, expected_project: str = "PPLWEBMYST") -> Tuple[bool, str]:
-        """Validate issue key matches expected project"""
-        project = issue_key.split("-")[0]
-        if project != expected_project:
-            return False, f"Issue {issue_key} is not in {expected_project} project"
-
-        return True, f"Issue key {issue_key} is in {expected_project}"
-
-    @staticmethod
-    def validate_link_type(link_type: str) -> Tuple[bool, str]:
-        """Validate link type is supported"""
-        if link_type not in LinkValidator.VALID_LINK_TYPES:
-            valid = ", ".join(LinkValidator.VALID_LINK_TYPES)
-            return False, f"Invalid link type: {link_type}. Supported types: {valid}"
-
-        return True, "Link type is valid"
-
-    @staticmethod
-    def validate_link_not_self(outward_key: str, inward_key: str) -> Tuple[bool, str]:
-        """Prevent linking an issue to itself"""
-        if outward_key.upper() == inward_key.upper():
-            return False, f"Cannot link issue {outward_key} to itself"
-
-        return True, "Issues are different"
-
-    @staticmethod
-    def validate_link_symmetry(link_type: str, is_directional_create: bool = True) -> Tuple[bool, str]:
-        """Validate link type has proper symmetry"""
-        link_info = LinkValidator.DIRECTIONAL_LINKS.get(link_type)
-        if not link_info:
-            return False, f"Link type {link_type} not found in directional links"
-
-        # All our links are directional
-        return True, "Link type has proper directional semantics"
-
-    @staticmethod
-    def validate_blocking_hierarchy(
-        outward_key: str, inward_key: str, link_type: str, existing_links: List[Dict] = None
-    ) -> Tuple[bool, str]:
-        """
-        Prevent circular blocking dependencies
-        existing_links: List of {"from": "KEY-1", "to": "KEY-2", "type": "Blocks"}
-        """
-        if link_type != "Blocks":
-            return True, "Not a blocking link, no circular dependency check needed"
-
-        if existing_links is None:
-            existing_links = []
-
-        # Build a map of existing blocking relationships
-        blocking_map = {}
-        for link in existing_links:
-            if link.get("type") == "Blocks":
-                from_key = link.get("from")
-                to_key = link.get("to")
-                if from_key not in blocking_map:
-                    blocking_map[from_key] = []
-                blocking_map[from_key].append(to_key)
-
-        # Check if creating this link would create a cycle
-        # Path: inward_key -> (existing links) -> outward_key
-        # This would create: outward_key -> inward_key -> ... -> outward_key (cycle)
-
-        def has_path(from_key: str, to_key: str, visited: set = None) -> bool:
-            """Check if there's a path from from_key to to_key"""
-            if visited is None:
-                visited = set()
-
-            if from_key in visited:
-                return False
-
-            if from_key == to_key:
-                return True
-
-            visited.add(from_key)
-            for blocked_by in blocking_map.get(from_key, []):
-                if has_path(blocked_by, to_key, visited):
-                    return True
-
-            return False
-
-        # Check if creating outward -> inward would create a cycle
-        if has_path(inward_key, outward_key):
-            return False, f"Creating link would create circular dependency: {outward_key} -> {inward_key} -> ... -> {outward_key}"
-
-        return True, "No circular dependencies detected"
-
-    @staticmethod
-    def validate_link_not_duplicate(
-        outward_key: str, inward_key: str, link_type: str, existing_links: List[Dict] = None
-    ) -> Tuple[bool, str]:
-        """Prevent creating duplicate links"""
-        if existing_links is None:
-            existing_links = []
-
-        for link in existing_links:
-            if (
-                link.get("from") == outward_key
-                and link.get("to") == inward_key
-                and link.get("type") == link_type
-            ):
-                return False, f"Link already exists: {outward_key} {link_type} {inward_key}"
-
-        return True, "Link does not already exist"
-
-    @staticmethod
-    def validate_link_operation(
-        outward_key: str, inward_key: str, link_type: str, existing_links: List[Dict] = None
-    ) -> Dict:
-        """
-        Comprehensive validation of a link operation
-        Returns: {"valid": bool, "errors": [], "warnings": []}
-        """
-        errors = []
-        warnings = []
-
-        # Validate outward issue key
-        valid, msg = LinkValidator.validate_issue_key_format(outward_key)
-        if not valid:
-            errors.append({"field": "outward_key", "error": msg})
+# Key prefix for the default project
+_PROJECT_PREFIX = "PPLWEBMYST-"
 
-        valid, msg = LinkValidator.validate_issue_key_project(outward_key)
-        if not valid:
-            errors.append({"field": "outward_key", "error": msg})
+# Existing links as given by callers, or an index of (from, to, type) tuples
+LinkIndex = Set[Tuple[str, str, str]]
+ExistingLinks = Union[List[Dict], LinkIndex]
 
-        # Validate inward issue key
-        valid, msg = LinkValidator.validate_issue_key_format(inward_key)
-        if not valid:
-            errors.append({"field": "inward_key", "error": msg})
 
-        valid, msg = LinkValidator.validate_issue_key_project(inward_key)
-        if not valid:
-            errors.append({"field": "inward_key", "error": msg})
+def _index_links(existing_links: List[Dict]) -> LinkIndex:
+    """Index existing links as a set of (from, to, type) tuples"""
+    return {(link.get("from"), link.get("to"), link.get("type")) for link in existing_links}
 
-        # Validate link type
-        valid, msg = LinkValidator.validate_link_type(link_type)
-        if not valid:
-            errors.append({"field": "link_type", "error": msg})
-            return {"valid": False, "errors": errors, "warnings": warnings}
 
-        # Check for self-link
-        valid, msg = LinkValidator.validate_link_not_self(outward_key, inward_key)
-        if not valid:
-            errors.append({"field": "link", "error": msg})
+def _as_link_index(existing_links: ExistingLinks = None) -> LinkIndex:
+    """Return existing_links as a link index, building it only if needed"""
+    if existing_links is None:
+        return set()
+    if isinstance(existing_links, (set, frozenset)):
+        return existing_links
+    return _index_links(existing_links)
+
+
+def _build_blocking_map(link_index: LinkIndex) -> Dict[str, List[str]]:
+    """Map each issue key to the keys it blocks"""
+    blocking_map = defaultdict(list)
+    for from_key, to_key, link_type in link_index:
+        if link_type == "Blocks":
+            blocking_map[from_key].append(to_key)
+    return blocking_map
+
+
+def _has_path(blocking_map: Dict[str, List[str]], from_key: str, to_key: str) -> bool:
+    """Check if there's a blocking path from from_key to to_key"""
+    stack = [from_key]
+    visited = {from_key}
+    while stack:
+        node = stack.pop()
+        if node == to_key:
+            return True
+
+        for blocked in blocking_map.get(node, ()):
+            if blocked not in visited:
+                visited.add(blocked)
+                stack.append(blocked)
+
+    return False
+
+
+# Valid link types
+VALID_LINK_TYPES = [
+    "Blocks",
+    "Relates to",
+    "Duplicates",
+    "Clones",
+    "is part of",  # Epic link
+]
+VALID_LINK_TYPES_SET = frozenset(VALID_LINK_TYPES)
+_VALID_LINK_TYPES_STR = ", ".join(VALID_LINK_TYPES)
+
+# Directional links (have outward/inward)
+DIRECTIONAL_LINKS = {
+    "Blocks": {"outward": "blocks", "inward": "is blocked by"},
+    "Relates to": {"outward": "relates to", "inward": "relates to"},
+    "Duplicates": {"outward": "duplicates", "inward": "is duplicated by"},
+    "Clones": {"outward": "clones", "inward": "is cloned by"},
+    "is part of": {"outward": "is part of", "inward": "contains"},
+}
+
+
+def _validate_issue_key_format(issue_key: str) -> Tuple[bool, str]:
+    """Validate issue key format (PROJECT-NUMBER)"""
+    if not _is_valid_key(issue_key):
+        return False, f"Invalid issue key format: {issue_key}. Expected: PROJECT-NUMBER"
+
+    return True, "Issue key format is valid"
+
+
+def _validate_issue_key_project(issue_key: str, expected_project: str = "PPLWEBMYST") -> Tuple[bool, str]:
+    """Validate issue key matches expected project"""
+    prefix = _PROJECT_PREFIX if expected_project == "PPLWEBMYST" else f"{expected_project}-"
+    if not issue_key.startswith(prefix) and issue_key != expected_project:
+        return False, f"Issue {issue_key} is not in {expected_project} project"
+
+    return True, f"Issue key {issue_key} is in {expected_project}"
+
+
+def _validate_issue_key(issue_key: str, expected_project: str = "PPLWEBMYST") -> Tuple[bool, str]:
+    """Validate issue key format and project in one pass"""
+    if expected_project == "PPLWEBMYST" and _PPLWEBMYST_KEY_RE.match(issue_key):
+        return True, f"Issue key {issue_key} is valid"
+
+    # Slow path: report the first failing check
+    valid, msg = _validate_issue_key_format(issue_key)
+    if not valid:
+        return False, msg
+
+    valid, msg = _validate_issue_key_project(issue_key, expected_project)
+    if not valid:
+        return False, msg
 
-        # Check for circular dependencies (if blocking link)
-        valid, msg = LinkValidator.validate_blocking_hierarchy(
-            outward_key, inward_key, link_type, existing_links
-        )
+    return True, f"Issue key {issue_key} is valid"
+
+
+def _validate_link_type(link_type: str) -> Tuple[bool, str]:
+    """Validate link type is supported"""
+    if link_type not in VALID_LINK_TYPES_SET:
+        return False, f"Invalid link type: {link_type}. Supported types: {_VALID_LINK_TYPES_STR}"
+
+    return True, "Link type is valid"
+
+
+def _validate_link_not_self(outward_key: str, inward_key: str) -> Tuple[bool, str]:
+    """Prevent linking an issue to itself"""
+    if outward_key.upper() == inward_key.upper():
+        return False, f"Cannot link issue {outward_key} to itself"
+
+    return True, "Issues are different"
+
+
+def _validate_link_symmetry(link_type: str, is_directional_create: bool = True) -> Tuple[bool, str]:
+    """Validate link type has proper symmetry"""
+    link_info = DIRECTIONAL_LINKS.get(link_type)
+    if not link_info:
+        return False, f"Link type {link_type} not found in directional links"
+
+    # All our links are directional
+    return True, "Link type has proper directional semantics"
+
+
+def _validate_blocking_hierarchy(
+    outward_key: str,
+    inward_key: str,
+    link_type: str,
+    existing_links: ExistingLinks = None,
+    blocking_map: Dict[str, List[str]] = None,
+) -> Tuple[bool, str]:
+    """
+    Prevent circular blocking dependencies
+    existing_links: List of {"from": "KEY-1", "to": "KEY-2", "type": "Blocks"},
+    or a prebuilt index of (from, to, type) tuples
+    blocking_map: Optional prebuilt {key: [blocked keys]} map, used instead of existing_links
+    """
+    if link_type != "Blocks":
+        return True, "Not a blocking link, no circular dependency check needed"
+
+    if blocking_map is None:
+        blocking_map = _build_blocking_map(_as_link_index(existing_links))
+
+    # Check if creating this link would create a cycle
+    # Path: inward_key -> (existing links) -> outward_key
+    # This would create: outward_key -> inward_key -> ... -> outward_key (cycle)
+    if _has_path(blocking_map, inward_key, outward_key):
+        return False, f"Creating link would create circular dependency: {outward_key} -> {inward_key} -> ... -> {outward_key}"
+
+    return True, "No circular dependencies detected"
+
+
+def _validate_link_not_duplicate(
+    outward_key: str, inward_key: str, link_type: str, existing_links: ExistingLinks = None
+) -> Tuple[bool, str]:
+    """Prevent creating duplicate links"""
+    if (outward_key, inward_key, link_type) in _as_link_index(existing_links):
+        return False, f"Link already exists: {outward_key} {link_type} {inward_key}"
+
+    return True, "Link does not already exist"
+
+
+def _validate_link_operation(
+    outward_key: str, inward_key: str, link_type: str, existing_links: ExistingLinks = None
+) -> Dict:
+    """
+    Comprehensive validation of a link operation
+    Returns: {"valid": bool, "errors": [], "warnings": []}
+    """
+    errors = []
+    warnings = []
+
+    # Validate issue keys: one match covers format and project for PPLWEBMYST keys,
+    # the separate checks only run to report every error on an invalid key
+    for field, issue_key in (("outward_key", outward_key), ("inward_key", inward_key)):
+        if _PPLWEBMYST_KEY_RE.match(issue_key):
+            continue
+
+        valid, msg = _validate_issue_key_format(issue_key)
         if not valid:
-            errors.append({"field": "link", "error": msg})
+            errors.append({"field": field, "error": msg})
 
-        # Check for duplicates
-        valid, msg = LinkValidator.validate_link_not_duplicate(
-            outward_key, inward_key, link_type, existing_links
-        )
+        valid, msg = _validate_issue_key_project(issue_key)
         if not valid:
-            warnings.append({"field": "link", "warning": msg})
-
-        return {
-            "valid": len(errors) == 0,
-            "errors": errors,
-            "warnings": warnings,
-            "outward": outward_key,
-            "inward": inward_key,
-            "link_type": link_type,
-        }
+            errors.append({"field": field, "error": msg})
+
+    # Validate link type
+    valid, msg = _validate_link_type(link_type)
+    if not valid:
+        errors.append({"field": "link_type", "error": msg})
+        return {"valid": False, "errors": errors, "warnings": warnings}
+
+    # Check for self-link
+    valid, msg = _validate_link_not_self(outward_key, inward_key)
+    if not valid:
+        errors.append({"field": "link", "error": msg})
+
+    # Index existing links once for the cycle and duplicate checks
+    link_index = _as_link_index(existing_links)
+
+    # Check for circular dependencies (if blocking link)
+    blocking_map = _build_blocking_map(link_index) if link_type == "Blocks" else None
+    valid, msg = _validate_blocking_hierarchy(
+        outward_key, inward_key, link_type, link_index, blocking_map
+    )
+    if not valid:
+        errors.append({"field": "link", "error": msg})
+
+    # Check for duplicates
+    valid, msg = _validate_link_not_duplicate(
+        outward_key, inward_key, link_type, link_index
+    )
+    if not valid:
+        warnings.append({"field": "link", "warning": msg})
+
+    return {
+        "valid": len(errors) == 0,
+        "errors": errors,
+        "warnings": warnings,
+        "outward": outward_key,
+        "inward": inward_key,
+        "link_type": link_type,
+    }
+
+
+class LinkValidator:
+    """Validates issue link operations"""
+
+    # Module-level constants and functions, kept on the class for backwards compatibility
+    VALID_LINK_TYPES = VALID_LINK_TYPES
+    VALID_LINK_TYPES_SET = VALID_LINK_TYPES_SET
+    DIRECTIONAL_LINKS = DIRECTIONAL_LINKS
+
+    validate_issue_key_format = staticmethod(_validate_issue_key_format)
+    validate_issue_key_project = staticmethod(_validate_issue_key_project)
+    validate_issue_key = staticmethod(_validate_issue_key)
+    validate_link_type = staticmethod(_validate_link_type)
+    validate_link_not_self = staticmethod(_validate_link_not_self)
+    validate_link_symmetry = staticmethod(_validate_link_symmetry)
+    validate_blocking_hierarchy = staticmethod(_validate_blocking_hierarchy)
+    validate_link_not_duplicate = staticmethod(_validate_link_not_duplicate)
+    validate_link_operation = staticmethod(_validate_link_operation)
 
 
 if __name__ == "__main__":
@@ -4,10 +4,158 @@ Jira Sprint Helper for PPLWEBMYST
 Utilities for sprint planning, capacity calculation, and management
 """
 
-import json
-from typing import List, Dict, Tuple
-from datetime import datetime, timedelta
+import sys
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from datetime import date, datetime, timedelta
 from enum import Enum
+from types import MappingProxyType
+
+# Standard sprint durations (in days)
+SPRINT_DURATIONS = MappingProxyType({
+    "1-week": 5,
+    "2-week": 10,
+    "3-week": 15,
+    "4-week": 20,
+})
+
+# _TAIL_WEEKDAYS[start_weekday][days]: weekdays (Mon-Fri) among the first `days` days from start_weekday
+_TAIL_WEEKDAYS = tuple(
+    tuple(sum(1 for offset in range(days) if (weekday + offset) % 7 < 5) for days in range(7))
+    for weekday in range(7)
+)
+
+# Sprint health by number of thresholds met (completion within 25, then 10 points of expected)
+_HEALTH_TABLE = (("CRITICAL", "red"), ("AT_RISK", "yellow"), ("HEALTHY", "green"))
+_HEALTH_THRESHOLDS = (25, 10)
+
+# Health batches with more sprints than this use the compiled kernel when Numba is available
+_COMPILED_HEALTH_MIN_SPRINTS = 1000
+
+
+def _health_kernel(issues_total, issues_completed, issues_in_progress, sprint_days_total, sprint_days_elapsed):
+    """
+    Numeric core of analyze_sprint_health (sprint_days_total must be non-zero)
+    Returns (health index into _HEALTH_TABLE, progress %, completion %, blocked %, on_track)
+    """
+    progress_percent = (sprint_days_elapsed / sprint_days_total) * 100
+    if issues_total > 0:
+        completion_percent = issues_completed / issues_total * 100
+        blocked_percent = (issues_total - issues_completed - issues_in_progress) / issues_total * 100
+    else:
+        completion_percent = blocked_percent = 0
+
+    # Health scoring: count thresholds met (progress is the expected completion at this point)
+    at_risk_margin, healthy_margin = _HEALTH_THRESHOLDS
+    health_index = (completion_percent >= progress_percent - at_risk_margin) + (
+        completion_percent >= progress_percent - healthy_margin
+    )
+    on_track = completion_percent >= (progress_percent - 15)
+
+    return health_index, progress_percent, completion_percent, blocked_percent, on_track
+
+
+# Bound by _load_health_batch_kernel, so Numba is only imported once a batch needs it
+np = prange = _health_kernel_compiled = None
+
+
+def _health_batch_loop(issues_total, issues_completed, issues_in_progress, sprint_days_total, sprint_days_elapsed):
+    """Vectorized _health_kernel over 1-D arrays (compiled with Numba); health index is -1 where sprint_days_total is 0"""
+    n = issues_total.shape[0]
+    health_index = np.full(n, -1, dtype=np.int64)
+    progress = np.zeros(n)
+    completion = np.zeros(n)
+    blocked = np.zeros(n)
+    on_track = np.zeros(n, dtype=np.bool_)
+    for i in prange(n):
+        if sprint_days_total[i] != 0:
+            health_index[i], progress[i], completion[i], blocked[i], on_track[i] = _health_kernel_compiled(
+                issues_total[i], issues_completed[i], issues_in_progress[i], sprint_days_total[i], sprint_days_elapsed[i]
+            )
+    return health_index, progress, completion, blocked, on_track
+
+
+@lru_cache(maxsize=None)
+def _load_health_batch_kernel():
+    """Compile _health_batch_loop on first use; None when Numba is not installed"""
+    global np, prange, _health_kernel_compiled
+    try:
+        import numpy as np
+        from numba import njit, prange
+    except ImportError:  # Optional: batch health analysis falls back to a pure-Python loop
+        return None
+
+    _health_kernel_compiled = njit(cache=True)(_health_kernel)
+    return njit(parallel=True, cache=True)(_health_batch_loop)
+
+
+if sys.version_info >= (3, 11):
+    def _fast_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC"""
+        # fromisoformat accepts "Z" natively, except after a date-only value ("2024-01-01Z")
+        try:
+            return datetime.fromisoformat(value)
+        except ValueError:
+            if not value.endswith("Z"):
+                raise
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+else:
+    def _fast_iso(value: str) -> datetime:
+        """Parse an ISO 8601 timestamp, accepting a trailing "Z" for UTC"""
+        # Only Z-suffixed values need rewriting; everything else goes straight to the C parser
+        if value.endswith("Z"):
+            value = value[:-1] + "+00:00"
+        return datetime.fromisoformat(value)
+
+
+@lru_cache(maxsize=256)
+def _calc_sprint_duration_cached(start_date: str, end_date: str) -> int:
+    """Sprint duration in days, memoized per date pair"""
+    try:
+        start = _fast_iso(start_date)
+        end = _fast_iso(end_date)
+        return (end - start).days
+    except Exception:
+        return 0
+
+
+def _working_days_from_dt(start: datetime, end: datetime, exclude_weekends: bool = True) -> int:
+    """Working days between two datetimes, inclusive"""
+    total_days = (end - start).days + 1
+    if total_days <= 0:
+        return 0
+    if not exclude_weekends:
+        return total_days
+
+    # Every full week has 5 weekdays (0-4 = Mon-Fri), the remainder comes from the table
+    full_weeks, extra_days = divmod(total_days, 7)
+    return full_weeks * 5 + _TAIL_WEEKDAYS[start.weekday()][extra_days]
+
+
+@lru_cache(maxsize=256)
+def _calc_working_days_cached(start_date: str, end_date: str, exclude_weekends: bool = True) -> int:
+    """Working days in sprint, memoized per date pair"""
+    try:
+        return _working_days_from_dt(_fast_iso(start_date), _fast_iso(end_date), exclude_weekends)
+    except Exception:
+        return 0
+
+
+@lru_cache(maxsize=32)
+def _plan_sprint_dates_cached(duration_key: str, today: date) -> dict:
+    """Sprint dates for a duration, computed once per day"""
+    duration_days = SPRINT_DURATIONS.get(duration_key, 10)
+
+    # Align to Monday at midnight, so timestamps don't carry the time of the call
+    start_date = datetime.combine(today - timedelta(days=today.weekday()), datetime.min.time())
+    end_date = start_date + timedelta(days=duration_days)
+
+    return {
+        "start_date": f"{start_date.isoformat()}Z",
+        "end_date": f"{end_date.isoformat()}Z",
+        "duration_days": duration_days,
+        "working_days": _working_days_from_dt(start_date, end_date),
+    }
 
 
 class SprintState(Enum):
@@ -17,277 +165,369 @@ class SprintState(Enum):
     CLOSED = "CLOSED"
 
 
-class SprintHelper:
-    """Helper utilities for sprint operations"""
+# Templates always start sprints in FUTURE; hoisted so building one skips the enum lookup
+_FUTURE = SprintState.FUTURE.value
 
-    # Standard sprint durations (in days)
-    SPRINT_DURATIONS = {
-        "1-week": 5,
-        "2-week": 10,
-        "3-week": 15,
-        "4-week": 20,
-    }
 
-    @staticmethod
-    def validate_sprint_name(name: str) -> Tuple[bool, str]:
-        """Validate sprint name format"""
-        if not name or not isinstance(name, str):
-            return False, "Sprint name is required and must be a string"
+def validate_sprint_name(name: str) -> tuple[bool, str]:
+    """Validate sprint name format"""
+    if not name or not isinstance(name, str):
+        return False, "Sprint name is required and must be a string"
 
-        if len(name.strip()) == 0:
-            return False, "Sprint name cannot be empty"
+    if len(name.strip()) == 0:
+        return False, "Sprint name cannot be empty"
 
-        if len(name) > 255:
-            return False, f"Sprint name too long (max 255 chars, got {len(name)})"
+    if len(name) > 255:
+        return False, f"Sprint name too long (max 255 chars, got {len(name)})"
 
-        return True, "Sprint name is valid"
+    return True, "Sprint name is valid"
 
-    @staticmethod
-    def validate_sprint_goal(goal: str = None) -> Tuple[bool, str]:
-        """Validate sprint goal"""
-        if goal is None:
-            return True, "Sprint goal is optional"
 
-        if not isinstance(goal, str):
-            return False, "Sprint goal must be a string"
+def validate_sprint_goal(goal: str = None) -> tuple[bool, str]:
+    """Validate sprint goal"""
+    if goal is None:
+        return True, "Sprint goal is optional"
 
-        if len(goal) > 1000:
-            return False, f"Sprint goal too long (max 1000 chars, got {len(goal)})"
+    if not isinstance(goal, str):
+        return False, "Sprint goal must be a string"
 
-        return True, "Sprint goal is valid"
+    if len(goal) > 1000:
+        return False, f"Sprint goal too long (max 1000 chars, got {len(goal)})"
 
-    @staticmethod
-    def validate_sprint_dates(start_date: str, end_date: str = None) -> Tuple[bool, str]:
-        """Validate sprint date format (ISO 8601)"""
-        try:
-            start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-        except (ValueError, AttributeError):
-            return False, f"Invalid start_date format: {start_date}. Use ISO 8601"
+    return True, "Sprint goal is valid"
 
-        if end_date:
-            try:
-                end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            except (ValueError, AttributeError):
-                return False, f"Invalid end_date format: {end_date}. Use ISO 8601"
 
-            if end <= start:
-                return False, "end_date must be after start_date"
+def validate_sprint_dates(start_date: str, end_date: str = None) -> tuple[bool, str]:
+    """Validate sprint date format (ISO 8601)"""
+    try:
+        start = _fast_iso(start_date)
+    except (ValueError, AttributeError, TypeError):
+        return False, f"Invalid start_date format: {start_date}. Use ISO 8601"
 
-        return True, "Sprint dates are valid"
-
-    @staticmethod
-    def calculate_sprint_duration(start_date: str, end_date: str) -> int:
-        """Calculate sprint duration in days"""
+    if end_date:
+        try:
+            end = _fast_iso(end_date)
+        except (ValueError, AttributeError, TypeError):
+            return False, f"Invalid end_date format: {end_date}. Use ISO 8601"
+
+        if end <= start:
+            return False, "end_date must be after start_date"
+
+    return True, "Sprint dates are valid"
+
+
+def calculate_working_days_batch(
+    start_dates: list[str],
+    end_dates: list[str],
+    exclude_weekends: bool = True,
+    holidays: list[str] = None,
+) -> list[int]:
+    """
+    Calculate working days for many sprints at once
+    holidays: optional dates (YYYY-MM-DD) that are not counted as working days
+    Invalid date pairs count as 0, like calculate_working_days
+    Raises ValueError if start_dates and end_dates differ in length
+    """
+    if len(start_dates) != len(end_dates):
+        raise ValueError("start_dates and end_dates must have the same length")
+
+    holiday_days = sorted({
+        day for day in map(date.fromisoformat, holidays or ())
+        if not exclude_weekends or day.weekday() < 5
+    })
+
+    results = []
+    for start_date, end_date in zip(start_dates, end_dates):
         try:
-            start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
-            return (end - start).days
+            start = _fast_iso(start_date)
+            end = _fast_iso(end_date)
+            working_days = _working_days_from_dt(start, end, exclude_weekends)
         except Exception:
-            return 0
+            results.append(0)
+            continue
+
+        if holiday_days and working_days:
+            # Holidays falling on the counted days: start's date through (end - start).days later
+            first_day = start.date()
+            last_day = first_day + timedelta(days=(end - start).days)
+            working_days -= bisect_right(holiday_days, last_day) - bisect_left(holiday_days, first_day)
+
+        results.append(working_days)
+
+    return results
+
+
+def calculate_sprint_duration(start_date: str, end_date: str) -> int:
+    """Calculate sprint duration in days"""
+    try:
+        return _calc_sprint_duration_cached(start_date, end_date)
+    except TypeError:  # Unhashable arguments can't be cached; run the uncached body
+        return _calc_sprint_duration_cached.__wrapped__(start_date, end_date)
+
+
+def calculate_working_days(start_date: str, end_date: str, exclude_weekends: bool = True) -> int:
+    """Calculate working days in sprint"""
+    try:
+        return _calc_working_days_cached(start_date, end_date, exclude_weekends)
+    except TypeError:  # Unhashable arguments can't be cached; run the uncached body
+        return _calc_working_days_cached.__wrapped__(start_date, end_date, exclude_weekends)
+
+
+def plan_sprint_dates(duration_key: str = "2-week") -> dict:
+    """Generate sprint dates based on duration (cached for the current day)"""
+    return dict(_plan_sprint_dates_cached(duration_key, date.today()))
+
+
+@lru_cache(maxsize=128)
+def calculate_capacity(velocity: int, sprint_duration: int = 10, utilization: float = 0.8) -> int:
+    """
+    Calculate sprint capacity based on velocity
+    velocity: average items/points per 10-day sprint
+    utilization: team availability (0.8 = 80%)
+    """
+    if velocity <= 0:
+        return 0
+
+    # Adjust velocity for sprint duration
+    velocity_per_day = velocity / 10.0
+    base_capacity = velocity_per_day * sprint_duration
+
+    # Apply utilization factor
+    return int(base_capacity * utilization)
+
+
+@lru_cache(maxsize=128)
+def calculate_velocity_buffer(planned_capacity: int, buffer_percent: float = 0.2) -> int:
+    """Calculate safe capacity with buffer"""
+    buffer = int(planned_capacity * buffer_percent)
+    return planned_capacity - buffer
+
+
+def analyze_sprint_health(
+    issues_total: int,
+    issues_completed: int,
+    issues_in_progress: int,
+    sprint_days_total: int,
+    sprint_days_elapsed: int,
+) -> dict:
+    """
+    Analyze sprint health and progress
+    Returns health score and recommendations
+    """
+    if sprint_days_total == 0:
+        return {"health": "UNKNOWN", "message": "Invalid sprint duration"}
+
+    health_index, progress_percent, completion_percent, blocked_percent, on_track = _health_kernel(
+        issues_total, issues_completed, issues_in_progress, sprint_days_total, sprint_days_elapsed
+    )
+    health, color = _HEALTH_TABLE[health_index]
 
-    @staticmethod
-    def calculate_working_days(start_date: str, end_date: str, exclude_weekends: bool = True) -> int:
-        """Calculate working days in sprint"""
-        try:
-            start = datetime.fromisoformat(start_date.replace("Z", "+00:00"))
-            end = datetime.fromisoformat(end_date.replace("Z", "+00:00"))
+    # Recommendations
+    checks = (
+        (blocked_percent > 20, "High number of blocked issues - review blockers"),
+        (completion_percent < (progress_percent * 0.5), "Behind schedule - consider scope reduction or removing blockers"),
+        (issues_in_progress > issues_total * 0.4, "Too many WIP items - focus on completion over starting new"),
+    )
+    recommendations = [message for flagged, message in checks if flagged]
+
+    return {
+        "health": health,
+        "color": color,
+        "progress_percent": round(progress_percent, 1),
+        "completion_percent": round(completion_percent, 1),
+        "blocked_percent": round(blocked_percent, 1),
+        "on_track": on_track,
+        "recommendations": recommendations,
+    }
 
-            working_days = 0
-            current = start
 
-            while current <= end:
-                # Check if weekday (0-4 = Mon-Fri)
-                if exclude_weekends:
-                    if current.weekday() < 5:
-                        working_days += 1
-                else:
-                    working_days += 1
+def analyze_sprint_health_batch(
+    issues_total: list[int],
+    issues_completed: list[int],
+    issues_in_progress: list[int],
+    sprint_days_total: list[int],
+    sprint_days_elapsed: list[int],
+) -> dict[str, list]:
+    """
+    Analyze health for many sprints at once (e.g. velocity-trend dashboards)
+    Takes one list per analyze_sprint_health argument and returns one list per metric;
+    sprints with sprint_days_total == 0 get health "UNKNOWN" and None metrics
+    Recommendations are not included; use analyze_sprint_health for a single sprint
+    Raises ValueError if the lists differ in length
+    """
+    columns = (issues_total, issues_completed, issues_in_progress, sprint_days_total, sprint_days_elapsed)
+    sprint_count = len(issues_total)
+    if any(len(column) != sprint_count for column in columns):
+        raise ValueError("All sprint health columns must have the same length")
+
+    kernel = _load_health_batch_kernel() if sprint_count > _COMPILED_HEALTH_MIN_SPRINTS else None
+    if kernel is not None:
+        # float64 so fractional inputs give the same metrics as analyze_sprint_health
+        arrays = [np.asarray(column, dtype=np.float64) for column in columns]
+        kernel_rows = zip(*(values.tolist() for values in kernel(*arrays)))
+        # The kernel returns floats throughout; analyze_sprint_health reports int 0 for sprints without issues
+        rows = (
+            row if total > 0 else (row[0], row[1], 0, 0, row[4])
+            for total, row in zip(issues_total, kernel_rows)
+        )
+    else:
+        rows = (
+            _health_kernel(*args) if args[3] != 0 else (-1, None, None, None, None)
+            for args in zip(*columns)
+        )
+
+    result = {
+        "health": [],
+        "color": [],
+        "progress_percent": [],
+        "completion_percent": [],
+        "blocked_percent": [],
+        "on_track": [],
+    }
+    for health_index, progress_percent, completion_percent, blocked_percent, on_track in rows:
+        if health_index < 0:
+            health, color = "UNKNOWN", None
+            progress_percent = completion_percent = blocked_percent = on_track = None
+        else:
+            health, color = _HEALTH_TABLE[health_index]
+            progress_percent = round(progress_percent, 1)
+            completion_percent = round(completion_percent, 1)
+            blocked_percent = round(blocked_percent, 1)
+
+        result["health"].append(health)
+        result["color"].append(color)
+        result["progress_percent"].append(progress_percent)
+        result["completion_percent"].append(completion_percent)
+        result["blocked_percent"].append(blocked_percent)
+        result["on_track"].append(on_track)
+
+    return result
+
+
+def plan_capacity_allocation(
+    team_members: list[dict], sprint_capacity: int
+) -> dict:
+    """
+    Allocate sprint capacity across team members
+    team_members: [{"name": str, "allocation": float}]
+    allocation: member availability (1.0 = full-time, default), shares are relative to the team total
+    """
+    member_allocations = [m.get("allocation", 1.0) for m in team_members]
+    total_allocation = sum(member_allocations)
+
+    allocations = {
+        member["name"]: {
+            "capacity": int(sprint_capacity * (allocation_factor := allocation / total_allocation)),
+            "allocation_percent": allocation_factor * 100,
+        }
+        for member, allocation in zip(team_members, member_allocations)
+    }
 
-                current += timedelta(days=1)
+    return {
+        "total_capacity": sprint_capacity,
+        "allocations": allocations,
+        "team_size": len(team_members),
+    }
 
-            return working_days
-        except Exception:
-            return 0
-
-    @staticmethod
-    def plan_sprint_dates(duration_key: str = "2-week") -> Dict:
-        """Generate sprint dates based on duration"""
-        duration_days = SprintHelper.SPRINT_DURATIONS.get(duration_key, 10)
-
-        today = datetime.now()
-        # Align to Monday
-        start_date = today - timedelta(days=today.weekday())
-        end_date = start_date + timedelta(days=duration_days)
-
-        return {
-            "start_date": start_date.isoformat() + "Z",
-            "end_date": end_date.isoformat() + "Z",
-            "duration_days": duration_days,
-            "working_days": SprintHelper.calculate_working_days(
-                start_date.isoformat() + "Z",
-                end_date.isoformat() + "Z"
-            ),
-        }
 
-    @staticmethod
-    def calculate_capacity(velocity: int, sprint_duration: int = 10, utilization: float = 0.8) -> int:
-        """
-        Calculate sprint capacity based on velocity
-        velocity: average items/points per 10-day sprint
-        utilization: team availability (0.8 = 80%)
-        """
-        if velocity <= 0:
-            return 0
-
-        # Adjust velocity for sprint duration
-        velocity_per_day = velocity / 10.0
-        base_capacity = velocity_per_day * sprint_duration
-
-        # Apply utilization factor
-        adjusted_capacity = int(base_capacity * utilization)
-
-        return adjusted_capacity
-
-    @staticmethod
-    def calculate_velocity_buffer(planned_capacity: int, buffer_percent: float = 0.2) -> int:
-        """Calculate safe capacity with buffer"""
-        buffer = int(planned_capacity * buffer_percent)
-        return planned_capacity - buffer
-
-    @staticmethod
-    def analyze_sprint_health(
-        issues_total: int,
-        issues_completed: int,
-        issues_in_progress: int,
-        sprint_days_total: int,
-        sprint_days_elapsed: int,
-    ) -> Dict:
-        """
-        Analyze sprint health and progress
-        Returns health score and recommendations
-        """
-        if sprint_days_total == 0:
-            return {"health": "UNKNOWN", "message": "Invalid sprint duration"}
-
-        progress_percent = (sprint_days_elapsed / sprint_days_total) * 100
-        completion_percent = (issues_completed / issues_total * 100) if issues_total > 0 else 0
-        blocked_percent = ((issues_total - issues_completed - issues_in_progress) / issues_total * 100) if issues_total > 0 else 0
-
-        # Expected completion at this point
-        expected_completion = progress_percent
-
-        # Health scoring
-        if completion_percent >= expected_completion - 10:
-            health = "HEALTHY"
-            color = "green"
-        elif completion_percent >= expected_completion - 25:
-            health = "AT_RISK"
-            color = "yellow"
-        else:
-            health = "CRITICAL"
-            color = "red"
-
-        # Recommendations
-        recommendations = []
-        if blocked_percent > 20:
-            recommendations.append("High number of blocked issues - review blockers")
-        if completion_percent < (progress_percent * 0.5):
-            recommendations.append("Behind schedule - consider scope reduction or removing blockers")
-        if issues_in_progress > issues_total * 0.4:
-            recommendations.append("Too many WIP items - focus on completion over starting new")
-
-        return {
-            "health": health,
-            "color": color,
-            "progress_percent": round(progress_percent, 1),
-            "completion_percent": round(completion_percent, 1),
-            "blocked_percent": round(blocked_percent, 1),
-            "on_track": completion_percent >= (expected_completion - 15),
-            "recommendations": recommendations,
-        }
+@lru_cache(maxsize=512)
+def _summary_metrics(total_issues: int, completed_issues: int, velocity: int, team_size: int) -> tuple:
+    """Rounded (completion rate %, velocity per person), memoized since closed sprints never change"""
+    completion_rate = (completed_issues / total_issues * 100) if total_issues > 0 else 0
+    average_per_person = round(velocity / team_size, 1) if team_size > 0 else 0
+    return round(completion_rate, 1), average_per_person
+
+
+def generate_sprint_summary(
+    sprint_id: int,
+    sprint_name: str,
+    sprint_goal: str,
+    total_issues: int,
+    completed_issues: int,
+    velocity: int,
+    team_size: int,
+) -> dict:
+    """Generate summary report for sprint"""
+    completion_rate_percent, average_per_person = _summary_metrics(total_issues, completed_issues, velocity, team_size)
+
+    return {
+        "sprint_id": sprint_id,
+        "sprint_name": sprint_name,
+        "sprint_goal": sprint_goal,
+        "summary": {
+            "total_issues": total_issues,
+            "completed_issues": completed_issues,
+            "incomplete_issues": total_issues - completed_issues,
+            "completion_rate_percent": completion_rate_percent,
+        },
+        "team": {
+            "size": team_size,
+            "velocity": velocity,
+            "average_per_person": average_per_person,
+        },
+    }
 
-    @staticmethod
-    def plan_capacity_allocation(
-        team_members: List[Dict], sprint_capacity: int
-    ) -> Dict:
-        """
-        Allocate sprint capacity across team members
-        team_members: [{"name": str, "capacity": int, "allocation": float}]
-        """
-        total_allocation = sum(m.get("allocation", 1.0) for m in team_members)
-
-        allocations = {}
-        for member in team_members:
-            allocation_factor = member.get("allocation", 1.0) / total_allocation
-            member_capacity = int(sprint_capacity * allocation_factor)
-            allocations[member["name"]] = {
-                "capacity": member_capacity,
-                "allocation_percent": allocation_factor * 100,
-            }
-
-        return {
-            "total_capacity": sprint_capacity,
-            "allocations": allocations,
-            "team_size": len(team_members),
-        }
 
-    @staticmethod
-    def generate_sprint_summary(
-        sprint_id: int,
-        sprint_name: str,
-        sprint_goal: str,
-        total_issues: int,
-        completed_issues: int,
-        velocity: int,
-        team_size: int,
-    ) -> Dict:
-        """Generate summary report for sprint"""
-        completion_rate = (completed_issues / total_issues * 100) if total_issues > 0 else 0
-
-        return {
-            "sprint_id": sprint_id,
-            "sprint_name": sprint_name,
-            "sprint_goal": sprint_goal,
-            "summary": {
-                "total_issues": total_issues,
-                "completed_issues": completed_issues,
-                "incomplete_issues": total_issues - completed_issues,
-                "completion_rate_percent": round(completion_rate, 1),
-            },
-            "team": {
-                "size": team_size,
-                "velocity": velocity,
-                "average_per_person": round(velocity / team_size, 1) if team_size > 0 else 0,
-            },
-        }
+def _build_sprint_dict(name: str, goal: str, dates: dict) -> dict:
+    """Build a FUTURE sprint template from plan_sprint_dates output (dates is only read)"""
+    return {
+        "name": name,
+        "goal": goal,
+        "state": _FUTURE,
+        "start_date": dates["start_date"],
+        "end_date": dates["end_date"],
+        "working_days": dates["working_days"],
+    }
+
+
+def create_2week_sprint(sprint_number: int) -> dict:
+    """Create standard 2-week sprint"""
+    # Read the cached plan directly: only its fields are copied, so the defensive dict() is not needed
+    return _build_sprint_dict(
+        f"Sprint {sprint_number}",
+        f"Define goal for Sprint {sprint_number}",
+        _plan_sprint_dates_cached("2-week", date.today()),
+    )
+
+
+def create_feature_sprint(sprint_number: int, feature_name: str) -> dict:
+    """Create sprint for specific feature"""
+    return _build_sprint_dict(
+        f"Sprint {sprint_number}", f"Deliver {feature_name}", _plan_sprint_dates_cached("2-week", date.today())
+    )
+
+
+class SprintHelper:
+    """Helper utilities for sprint operations"""
+
+    # Module-level constants and functions, kept on the class for backwards compatibility
+    SPRINT_DURATIONS = SPRINT_DURATIONS
+
+    validate_sprint_name = staticmethod(validate_sprint_name)
+    validate_sprint_goal = staticmethod(validate_sprint_goal)
+    validate_sprint_dates = staticmethod(validate_sprint_dates)
+    calculate_sprint_duration = staticmethod(calculate_sprint_duration)
+    calculate_working_days = staticmethod(calculate_working_days)
+    calculate_working_days_batch = staticmethod(calculate_working_days_batch)
+    plan_sprint_dates = staticmethod(plan_sprint_dates)
+    calculate_capacity = staticmethod(calculate_capacity)
+    calculate_velocity_buffer = staticmethod(calculate_velocity_buffer)
+    analyze_sprint_health = staticmethod(analyze_sprint_health)
+    analyze_sprint_health_batch = staticmethod(analyze_sprint_health_batch)
+    plan_capacity_allocation = staticmethod(plan_capacity_allocation)
+    generate_sprint_summary = staticmethod(generate_sprint_summary)
 
 
 class SprintTemplates:
     """Pre-built sprint templates"""
 
-    @staticmethod
-    def create_2week_sprint(sprint_number: int) -> Dict:
-        """Create standard 2-week sprint"""
-        dates = SprintHelper.plan_sprint_dates("2-week")
-
-        return {
-            "name": f"Sprint {sprint_number}",
-            "goal": f"Define goal for Sprint {sprint_number}",
-            "state": SprintState.FUTURE.value,
-            "start_date": dates["start_date"],
-            "end_date": dates["end_date"],
-            "working_days": dates["working_days"],
-        }
-
-    @staticmethod
-    def create_feature_sprint(sprint_number: int, feature_name: str) -> Dict:
-        """Create sprint for specific feature"""
-        template = SprintTemplates.create_2week_sprint(sprint_number)
-        template["goal"] = f"Deliver {feature_name}"
-        return template
+    create_2week_sprint = staticmethod(create_2week_sprint)
+    create_feature_sprint = staticmethod(create_feature_sprint)
 
 
 if __name__ == "__main__":
+    import json
+
     # Example usage
     print("=== Sprint Planning ===")
     dates = SprintHelper.plan_sprint_dates("2-week")
@@ -309,9 +549,9 @@ if __name__ == "__main__":
 
     print("\n=== Team Capacity Allocation ===")
     team = [
-        {"name": "Alice", "capacity": 1.0},
-        {"name": "Bob", "capacity": 0.8},
-        {"name": "Charlie", "capacity": 1.0},
+        {"name": "Alice", "allocation": 1.0},
+        {"name": "Bob", "allocation": 0.8},
+        {"name": "Charlie", "allocation": 1.0},
     ]
     allocation = SprintHelper.plan_capacity_allocation(team, 24)
     print(json.dumps(allocation, indent=2))